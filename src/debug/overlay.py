@@ -11,25 +11,34 @@ import numpy as np
 from ..game.board import GameBoard, ARENA_COLS, ARENA_ROWS
 
 
-def draw_tile_grid(frame: np.ndarray, game_board: GameBoard) -> np.ndarray:
+# Rendered grid keyed by (frame shape, tile width, tile height) ->
+# (overlay, mask). The grid only changes with the capture size, so it is
+# drawn once and then blitted onto every frame.
+_GRID_CACHE: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _render_tile_grid(
+    shape: tuple[int, ...], tile_width: float, tile_height: float
+) -> tuple[np.ndarray, np.ndarray]:
     color = (0, 255, 255)
     thickness = 1
+    overlay = np.zeros(shape, dtype=np.uint8)
 
     for x in range(ARENA_COLS + 1):
-        x_pos = int(x * game_board.tile_width)
-        cv2.line(frame, (x_pos, 0), (x_pos, frame.shape[0]), color, thickness)
+        x_pos = int(x * tile_width)
+        cv2.line(overlay, (x_pos, 0), (x_pos, shape[0]), color, thickness)
     for y in range(ARENA_ROWS + 1):
-        y_pos = int(y * game_board.tile_height)
-        cv2.line(frame, (0, y_pos), (frame.shape[1], y_pos), color, thickness)
+        y_pos = int(y * tile_height)
+        cv2.line(overlay, (0, y_pos), (shape[1], y_pos), color, thickness)
 
     for x in range(ARENA_COLS):
         for y in range(ARENA_ROWS):
             if (x + y) % 2 == 0:
                 label = f"{x},{y}"
-                cx = int((x + 0.5) * game_board.tile_width)
-                cy = int((y + 0.5) * game_board.tile_height)
+                cx = int((x + 0.5) * tile_width)
+                cy = int((y + 0.5) * tile_height)
                 cv2.putText(
-                    frame,
+                    overlay,
                     label,
                     (cx - 20, cy + 5),
                     cv2.FONT_HERSHEY_SIMPLEX,
@@ -37,6 +46,24 @@ def draw_tile_grid(frame: np.ndarray, game_board: GameBoard) -> np.ndarray:
                     (255, 255, 255),
                     1,
                 )
+
+    # Grid and label colors are never black, so any non-zero pixel is ink.
+    # 2-D uint8 so cv2.copyTo can blit it; a broadcast bool mask through
+    # np.copyto costs more than drawing the grid directly.
+    mask = overlay.any(axis=2).astype(np.uint8)
+    return overlay, mask
+
+
+def draw_tile_grid(frame: np.ndarray, game_board: GameBoard) -> np.ndarray:
+    key = (frame.shape, game_board.tile_width, game_board.tile_height)
+    cached = _GRID_CACHE.get(key)
+    if cached is None:
+        cached = _render_tile_grid(
+            frame.shape, game_board.tile_width, game_board.tile_height
+        )
+        _GRID_CACHE[key] = cached
+    overlay, mask = cached
+    cv2.copyTo(overlay, mask, frame)
     return frame
 
 
@@ -46,14 +73,18 @@ def render_debug_overlay(
     state,
     detection_summary: dict | None = None,
     lifecycle_state: str | None = None,
+    in_place: bool = False,
 ) -> np.ndarray:
     """Annotate a captured frame with grid + status text.
 
     Detector boxes/labels are intentionally NOT drawn here so this is
     cheap to call without a Supervision dependency. ``main.py`` mixes
     in the annotated detection frame separately when desired.
+
+    Pass ``in_place=True`` to draw straight into ``frame`` instead of a
+    copy when the raw frame is not needed again.
     """
-    out = frame.copy()
+    out = frame if in_place else frame.copy()
     out = draw_tile_grid(out, board)
 
     lines: list[str] = []
@@ -22,6 +22,7 @@ import time
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 import pyautogui
 
 from ..game.cards import Card
@@ -102,22 +103,47 @@ class ActionExecutor:
         self.hand_positions = hand_positions
         self.drag_duration = drag_duration
 
+        # Screen-pixel lookups, rebuilt only when the capture region or
+        # board geometry changes (see ``_ensure_layout``).
+        self._layout_key: Optional[tuple] = None
+        self._hand_px: Optional[np.ndarray] = None
+        self._tile_px: Optional[np.ndarray] = None
+
     # ----- helpers -----
 
-    def _hand_pixel(self, hand_index: int, monitor: dict) -> tuple[int, int]:
-        fx, fy = self.hand_positions[hand_index]
-        return (
-            monitor["left"] + int(fx * monitor["width"]),
-            monitor["top"] + int(fy * monitor["height"]),
+    def _ensure_layout(self, board: GameBoard, monitor: dict) -> None:
+        key = (
+            monitor["left"],
+            monitor["top"],
+            monitor["width"],
+            monitor["height"],
+            board.tile_width,
+            board.tile_height,
+        )
+        if key != self._layout_key:
+            self._recompute_layout(board, monitor)
+            self._layout_key = key
+
+    def _recompute_layout(self, board: GameBoard, monitor: dict) -> None:
+        left, top = monitor["left"], monitor["top"]
+        self._hand_px = np.array(
+            [
+                (left + int(fx * monitor["width"]), top + int(fy * monitor["height"]))
+                for fx, fy in self.hand_positions
+            ],
+            dtype=np.int32,
         )
+        self._tile_px = board.tile_center_px + np.array([left, top], dtype=np.int32)
+
+    def _hand_pixel(self, hand_index: int) -> tuple[int, int]:
+        px = self._hand_px[hand_index]
+        return (int(px[0]), int(px[1]))
 
-    def _tile_pixel(
-        self, board: GameBoard, monitor: dict, tile_x: int, tile_y: int
-    ) -> tuple[int, int]:
-        local = board.convert_tile_to_image_cord(tile_x, tile_y)
-        if local is None:
+    def _tile_pixel(self, tile_x: int, tile_y: int) -> tuple[int, int]:
+        if not (0 <= tile_x < ARENA_COLS and 0 <= tile_y < ARENA_ROWS):
             raise ValueError(f"Bad tile ({tile_x},{tile_y})")
-        return (monitor["left"] + local[0], monitor["top"] + local[1])
+        px = self._tile_px[tile_y, tile_x]
+        return (int(px[0]), int(px[1]))
 
     # ----- main entry -----
 
@@ -153,8 +179,9 @@ class ActionExecutor:
         if state.get_current_elixir() < card.cost:
             return ActionResult(success=False, reason="not enough elixir")
 
-        start = self._hand_pixel(action.hand_index, monitor)
-        target = self._tile_pixel(board, monitor, action.tile_x, action.tile_y)
+        self._ensure_layout(board, monitor)
+        start = self._hand_pixel(action.hand_index)
+        target = self._tile_pixel(action.tile_x, action.tile_y)
 
         pyautogui.moveTo(start[0], start[1])
         time.sleep(POST_DRAG_PAUSE_SEC)
@@ -21,6 +21,10 @@ shaped rewards.
 Optional ``record_path`` writes a JSONL line per step suitable for
 imitation learning. Each line contains the flat observation, action
 index, raw reward, and lifecycle metadata.
+
+Optional ``infer_size`` (``(width, height)``, e.g. the detector's native
+input) resizes each frame once before inference; detections are scaled
+back to capture pixels before they reach ``GameBoard``.
 """
 
 from __future__ import annotations
@@ -28,8 +32,10 @@ from __future__ import annotations
 import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Optional
 
+import cv2
 import numpy as np
 
 from .actions import (
@@ -44,6 +50,7 @@ from ..vision.capture import ScreenCapture
 from ..game.board import GameBoard
 from ..game.state import GameState
 from ..vision.lifecycle import (
+    LifecycleSignals,
     MatchLifecycle,
     STATE_IN_MATCH,
     STATE_POSTMATCH,
@@ -55,6 +62,11 @@ from ..vision.ocr import TowerHealthReader
 # tests / static checks can import this module without the SDK.
 
 
+# Dummy inferences run once after the model loads so the first real frame
+# doesn't pay for session / engine build and allocator warm-up.
+MODEL_WARMUP_RUNS = 2
+
+
 RewardFn = Callable[[GameState, GameState, Optional[str], "ActionResult"], float]
 
 
@@ -116,6 +128,7 @@ class ClashEnv:
         reward_fn: Optional[RewardFn] = None,
         step_period_sec: float = 0.25,
         max_match_duration_sec: float = 320.0,
+        infer_size: Optional[tuple[int, int]] = None,
     ):
         self.window_title = window_title
         self.model_id = model_id
@@ -124,8 +137,10 @@ class ClashEnv:
         self.reward_fn = reward_fn or default_reward
         self.step_period_sec = step_period_sec
         self.max_match_duration_sec = max_match_duration_sec
+        self.infer_size = infer_size
 
         self.capture: Optional[ScreenCapture] = None
+        self._perception_pool: Optional[ThreadPoolExecutor] = None
         self.board: Optional[GameBoard] = None
         self.state = GameState()
         self.lifecycle = MatchLifecycle()
@@ -134,8 +149,14 @@ class ClashEnv:
         self.executor = ActionExecutor()
 
         self._model = None
+        self._model_warm: bool = False
         self._supervision = None
+        # Last captured frame. This is ScreenCapture's reused buffer, so the
+        # next grab overwrites it, and main.py's --debug overlay draws the
+        # grid / HUD into it after step() returns. Env code must only read
+        # it within the step that captured it.
         self._frame: Optional[np.ndarray] = None
+        self._infer_buf: Optional[np.ndarray] = None
         self._last_step_time: float = 0.0
         self._record_file = None
         self._step_count: int = 0
@@ -173,9 +194,14 @@ class ClashEnv:
         self._load_model()
         if self.capture is None:
             self.capture = ScreenCapture(self.window_title).__enter__()
+        if self._perception_pool is None:
+            self._perception_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="clashbot-perception"
+            )
 
         # If we're sitting on the postmatch screen, click through to a new battle.
         frame = self.capture.grab()
+        self._warm_up_model(frame)
         signals = self.lifecycle.detect_state(frame)
         if signals.state == STATE_POSTMATCH:
             self.lifecycle.auto_rematch(self.capture.monitor)
@@ -217,8 +243,7 @@ class ClashEnv:
         # Capture + perceive after the action lands.
         frame = self.capture.grab()
         self._frame = frame
-        self._refresh_perception(frame)
-        signals = self.lifecycle.detect_state(frame)
+        signals = self._refresh_perception(frame)
 
         # Determine done.
         done = False
@@ -268,6 +293,9 @@ class ClashEnv:
         if self.capture is not None:
             self.capture.__exit__(None, None, None)
             self.capture = None
+        if self._perception_pool is not None:
+            self._perception_pool.shutdown(wait=True)
+            self._perception_pool = None
 
     # ----- internals -----
 
@@ -292,15 +320,47 @@ class ClashEnv:
             f"Did not detect match start within {timeout_sec:.0f}s"
         )
 
-    def _refresh_perception(self, frame: np.ndarray) -> None:
+    def _refresh_perception(self, frame: np.ndarray) -> LifecycleSignals:
         assert self.board is not None and self._supervision is not None
-        results = self._model.infer(frame)[0]
+        assert self._perception_pool is not None
+        # Tower OCR and lifecycle template matching only read the frame.
+        # Tesseract runs as a subprocess and OpenCV / the detector release
+        # the GIL, so both workers overlap with inference on this thread.
+        readings_future = self._perception_pool.submit(self.tower_reader.read, frame)
+        signals_future = self._perception_pool.submit(
+            self.lifecycle.detect_state, frame
+        )
+        results = self._model.infer(self._prepare_infer_frame(frame))[0]
         detections = self._supervision.Detections.from_inference(results)
+        if self.infer_size is not None:
+            w, h = self.infer_size
+            sx = frame.shape[1] / w
+            sy = frame.shape[0] / h
+            detections.xyxy = detections.xyxy * np.array(
+                [sx, sy, sx, sy], dtype=detections.xyxy.dtype
+            )
         self.board.clear_arena()
         self.board.clear_hand()
         self.board.process_detections(detections)
-        readings = self.tower_reader.read(frame)
-        self.state.update_tower_hp(readings)
+        self.state.update_tower_hp(readings_future.result())
+        return signals_future.result()
+
+    def _warm_up_model(self, frame: np.ndarray) -> None:
+        if self._model_warm:
+            return
+        blank = np.zeros_like(self._prepare_infer_frame(frame))
+        for _ in range(MODEL_WARMUP_RUNS):
+            self._model.infer(blank)
+        self._model_warm = True
+
+    def _prepare_infer_frame(self, frame: np.ndarray) -> np.ndarray:
+        if self.infer_size is None:
+            return frame
+        w, h = self.infer_size
+        if self._infer_buf is None or self._infer_buf.shape[:2] != (h, w):
+            self._infer_buf = np.empty((h, w, frame.shape[2]), dtype=frame.dtype)
+        cv2.resize(frame, (w, h), dst=self._infer_buf, interpolation=cv2.INTER_AREA)
+        return self._infer_buf
 
     def _build_observation(self) -> dict:
         assert self.board is not None
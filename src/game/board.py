@@ -8,12 +8,14 @@ opposing top quadrant becomes placeable).
 
 from __future__ import annotations
 
+import logging
 from typing import Iterable, Optional
 
 import numpy as np
 
 from .cards import Card, Troop, BlankSpace, EMPTY_CARD, EMPTY_TILE, is_empty
 
+logger = logging.getLogger(__name__)
 
 ARENA_COLS = 9
 ARENA_ROWS = 16
@@ -76,6 +78,14 @@ TROOP_CLASSES: tuple[str, ...] = (
 )
 
 
+# Troop class names are "<color><troop>"; keyed on the first character,
+# which is enough once rows are pre-filtered to blue/red prefixes.
+_TROOP_COLOR_PREFIXES: dict[str, tuple[str, int]] = {
+    "b": ("blue", len("blue")),
+    "r": ("red", len("red")),
+}
+
+
 def _normalize_troop_name(name: str) -> str:
     return name.lower().replace(" ", "").replace("_", "").replace("-", "")
 
@@ -92,11 +102,21 @@ class GameBoard:
 
         self.tile_width = monitor_width / ARENA_COLS
         self.tile_height = monitor_height / ARENA_ROWS
-
-        self.cards_in_hand: list = [EMPTY_CARD] * HAND_SIZE
-        self.troops_in_arena: list[list] = [
-            [EMPTY_TILE for _ in range(ARENA_COLS)] for _ in range(ARENA_ROWS)
-        ]
+        # Pixel center of every tile, indexed [tile_y, tile_x] -> (x, y).
+        self.tile_center_px = np.empty((ARENA_ROWS, ARENA_COLS, 2), dtype=np.int32)
+        self.tile_center_px[..., 0] = (
+            (np.arange(ARENA_COLS) + 0.5) * self.tile_width
+        ).astype(np.int32)
+        self.tile_center_px[..., 1] = (
+            (np.arange(ARENA_ROWS)[:, None] + 0.5) * self.tile_height
+        ).astype(np.int32)
+
+        # Object arrays pre-filled with the shared sentinels: clearing is a
+        # single ``fill`` instead of per-slot Python assignments.
+        self.cards_in_hand: np.ndarray = np.full(HAND_SIZE, EMPTY_CARD, dtype=object)
+        self.troops_in_arena: np.ndarray = np.full(
+            (ARENA_ROWS, ARENA_COLS), EMPTY_TILE, dtype=object
+        )
 
     # ----- mutation helpers -----
 
@@ -104,24 +124,23 @@ class GameBoard:
         if 0 <= position < HAND_SIZE:
             self.cards_in_hand[position] = card
         else:
-            print(f"Invalid hand position: {position}. Must be 0-{HAND_SIZE-1}.")
+            logger.debug(
+                "Invalid hand position: %d. Must be 0-%d.", position, HAND_SIZE - 1
+            )
 
     def add_troop_to_arena(self, troop: Troop, x_cord: int, y_cord: int) -> None:
         if 0 <= x_cord < ARENA_COLS and 0 <= y_cord < ARENA_ROWS:
             troop.tile_x = x_cord
             troop.tile_y = y_cord
-            self.troops_in_arena[y_cord][x_cord] = troop
+            self.troops_in_arena[y_cord, x_cord] = troop
         else:
-            print(f"Invalid arena position: ({x_cord}, {y_cord})")
+            logger.debug("Invalid arena position: (%d, %d)", x_cord, y_cord)
 
     def clear_arena(self) -> None:
-        for row in self.troops_in_arena:
-            for x in range(ARENA_COLS):
-                row[x] = EMPTY_TILE
+        self.troops_in_arena.fill(EMPTY_TILE)
 
     def clear_hand(self) -> None:
-        for i in range(HAND_SIZE):
-            self.cards_in_hand[i] = EMPTY_CARD
+        self.cards_in_hand.fill(EMPTY_CARD)
 
     # ----- coordinate conversions -----
 
@@ -130,18 +149,32 @@ class GameBoard:
             return None
         if y_image_cord < 0 or y_image_cord > self.monitor_height:
             return None
-        tile_x = int(x_image_cord / self.tile_width)
-        tile_y = int(y_image_cord / self.tile_height)
-        tile_x = min(tile_x, ARENA_COLS - 1)
-        tile_y = min(tile_y, ARENA_ROWS - 1)
-        return (tile_x, tile_y)
+        tile_x, tile_y = self.convert_image_cords_to_tiles(
+            np.array([x_image_cord]), np.array([y_image_cord])
+        )
+        return (int(tile_x[0]), int(tile_y[0]))
+
+    def convert_image_cords_to_tiles(
+        self, x_image_cords: np.ndarray, y_image_cords: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Array form of ``convert_image_cord_to_tile``.
+
+        Returns ``(tile_x, tile_y)`` as int32 arrays clamped to the grid.
+        Callers are responsible for dropping out-of-frame points first.
+        """
+        tile_x = np.minimum(
+            (x_image_cords / self.tile_width).astype(np.int32), ARENA_COLS - 1
+        )
+        tile_y = np.minimum(
+            (y_image_cords / self.tile_height).astype(np.int32), ARENA_ROWS - 1
+        )
+        return tile_x, tile_y
 
     def convert_tile_to_image_cord(self, tile_x: int, tile_y: int):
         if not (0 <= tile_x < ARENA_COLS and 0 <= tile_y < ARENA_ROWS):
             return None
-        pixel_x = int((tile_x + 0.5) * self.tile_width)
-        pixel_y = int((tile_y + 0.5) * self.tile_height)
-        return (pixel_x, pixel_y)
+        pixel = self.tile_center_px[tile_y, tile_x]
+        return (int(pixel[0]), int(pixel[1]))
 
     # ----- placement rules -----
 
@@ -208,56 +241,70 @@ class GameBoard:
         cards_filtered: list[dict] = []
         troops_detected: list[dict] = []
 
-        for i in range(len(detections)):
-            class_name = detections.data["class_name"][i]
-            bbox = detections.xyxy[i]
-            center_x = (bbox[0] + bbox[2]) / 2
-            center_y = (bbox[1] + bbox[3]) / 2
-            bbox_w = bbox[2] - bbox[0]
-            bbox_h = bbox[3] - bbox[1]
-            bbox_area = bbox_w * bbox_h
-
+        if len(detections) == 0:
+            return {
+                "cards_in_hand": [],
+                "cards_filtered": cards_filtered,
+                "troops_on_board": troops_detected,
+            }
+
+        # Box geometry and tile mapping for the whole batch in one NumPy
+        # pass; the per-detection loop below only reads plain Python values.
+        xyxy = detections.xyxy
+        x0, y0, x1, y1 = xyxy.T
+        center_x = (x0 + x1) / 2
+        center_y = (y0 + y1) / 2
+        bbox_w = x1 - x0
+        bbox_h = y1 - y0
+        bbox_area = bbox_w * bbox_h
+        tile_xs, tile_ys = self.convert_image_cords_to_tiles(center_x, center_y)
+
+        rows = zip(
+            detections.data["class_name"],
+            center_x.tolist(),
+            center_y.tolist(),
+            bbox_w.tolist(),
+            bbox_h.tolist(),
+            bbox_area.tolist(),
+            tile_xs.tolist(),
+            tile_ys.tolist(),
+        )
+        for i, (class_name, cx, cy, w, h, area, tile_x, tile_y) in enumerate(rows):
             if class_name.startswith("card"):
-                card_name = class_name[4:]
                 cards_detected.append(
                     {
-                        "name": card_name,
-                        "pixel_coords": (center_x, center_y),
-                        "bbox": bbox,
-                        "width": bbox_w,
-                        "height": bbox_h,
-                        "area": bbox_area,
-                        "center_x": center_x,
-                        "center_y": center_y,
+                        "name": class_name[4:],
+                        "pixel_coords": (cx, cy),
+                        "bbox": xyxy[i],
+                        "width": w,
+                        "height": h,
+                        "area": area,
+                        "center_x": cx,
+                        "center_y": cy,
                     }
                 )
-            elif class_name.startswith("blue") or class_name.startswith("red"):
-                if class_name.startswith("blue"):
-                    color = "blue"
-                    troop_name = class_name[4:]
-                else:
-                    color = "red"
-                    troop_name = class_name[3:]
-                tile_coords = self.convert_image_cord_to_tile(center_x, center_y)
-                if tile_coords:
-                    troops_detected.append(
-                        {
-                            "name": troop_name,
-                            "color": color,
-                            "pixel_coords": (center_x, center_y),
-                            "tile_coords": tile_coords,
-                        }
-                    )
-                    self.add_troop_to_arena(
-                        Troop(troop_name, color), tile_coords[0], tile_coords[1]
-                    )
+            elif class_name.startswith(("blue", "red")):
+                if not (0 <= cx <= self.monitor_width and 0 <= cy <= self.monitor_height):
+                    continue
+                color, prefix_len = _TROOP_COLOR_PREFIXES[class_name[0]]
+                troop_name = class_name[prefix_len:]
+                troops_detected.append(
+                    {
+                        "name": troop_name,
+                        "color": color,
+                        "pixel_coords": (cx, cy),
+                        "tile_coords": (tile_x, tile_y),
+                    }
+                )
+                self.add_troop_to_arena(Troop(troop_name, color), tile_x, tile_y)
 
         if cards_detected:
-            cards_in_hand = self.filter_cards_in_hand(cards_detected)
+            kept = self.filter_cards_in_hand(cards_detected)
+            cards_in_hand = [c for c, k in zip(cards_detected, kept) if k]
             cards_in_hand.sort(key=lambda c: c["center_x"])
             for position, info in enumerate(cards_in_hand[:HAND_SIZE]):
                 self.add_card_to_hand(Card(info["name"]), position)
-            cards_filtered = [c for c in cards_detected if c not in cards_in_hand]
+            cards_filtered = [c for c, k in zip(cards_detected, kept) if not k]
         else:
             cards_in_hand = []
 
@@ -267,30 +314,41 @@ class GameBoard:
             "troops_on_board": troops_detected,
         }
 
-    def filter_cards_in_hand(self, cards_detected: list[dict]) -> list[dict]:
+    def filter_cards_in_hand(self, cards_detected: list[dict]) -> list[bool]:
+        """Pick the detected cards that sit in the hand row.
+
+        Returns a keep flag per entry of ``cards_detected`` (at most
+        ``HAND_SIZE`` kept, the largest areas winning when trimming). Drops
+        the smaller "up next" card and stray detections away from the hand
+        row.
+        """
         if len(cards_detected) <= HAND_SIZE:
-            return cards_detected
+            return [True] * len(cards_detected)
 
-        areas = sorted(c["area"] for c in cards_detected)
-        median_area = areas[len(areas) // 2]
-        ys = sorted(c["center_y"] for c in cards_detected)
-        median_y = ys[len(ys) // 2]
+        # Upper median (element n // 2), not an averaged one: with two
+        # clusters of cards an averaged median can fall between the rows.
+        mid = len(cards_detected) // 2
+        median_area = sorted(c["area"] for c in cards_detected)[mid]
+        median_y = sorted(c["center_y"] for c in cards_detected)[mid]
 
         size_threshold = 0.6
         y_threshold = self.monitor_height * 0.1
         left_edge_threshold = self.monitor_width * 0.15
 
         valid = [
-            c
-            for c in cards_detected
+            i
+            for i, c in enumerate(cards_detected)
             if c["area"] >= median_area * size_threshold
             and abs(c["center_y"] - median_y) < y_threshold
             and c["center_x"] > left_edge_threshold
         ]
         if len(valid) > HAND_SIZE:
-            valid.sort(key=lambda c: c["area"], reverse=True)
+            valid.sort(key=lambda i: cards_detected[i]["area"], reverse=True)
             valid = valid[:HAND_SIZE]
-        return valid
+        kept = [False] * len(cards_detected)
+        for i in valid:
+            kept[i] = True
+        return kept
 
     # ----- ML / debug serialization -----
 
@@ -306,7 +364,7 @@ class GameBoard:
         tensor = np.zeros((ARENA_ROWS, ARENA_COLS, channels), dtype=np.float32)
         for y in range(ARENA_ROWS):
             for x in range(ARENA_COLS):
-                cell = self.troops_in_arena[y][x]
+                cell = self.troops_in_arena[y, x]
                 if not isinstance(cell, Troop):
                     continue
                 key = _normalize_troop_name(cell.name)
@@ -344,22 +402,21 @@ class GameBoard:
         return out
 
     def get_board_state(self) -> str:
-        state = "=== CARDS IN HAND (Position 0-3, Left to Right) ===\n"
-        for i, card in enumerate(self.cards_in_hand):
-            if isinstance(card, Card):
-                state += f"Position {i}: {card.name} (Cost: {card.cost})\n"
+        parts = ["=== CARDS IN HAND (Position 0-3, Left to Right) ===\n"]
+        for i, card in enumerate(self.cards_in_hand.tolist()):
+            if is_empty(card):
+                parts.append(f"Position {i}: Empty\n")
             else:
-                state += f"Position {i}: Empty\n"
-
-        state += "\n=== TROOPS IN ARENA (9x16 grid) ===\n"
-        state += "   " + "".join(f"{i:3}" for i in range(ARENA_COLS)) + "\n"
-        for y in range(ARENA_ROWS):
-            state += f"{y:2} "
-            for x in range(ARENA_COLS):
-                cell = self.troops_in_arena[y][x]
-                if isinstance(cell, Troop):
-                    state += f" {cell.color[0].upper()}{cell.name[0]} "
+                parts.append(f"Position {i}: {card.name} (Cost: {card.cost})\n")
+
+        parts.append("\n=== TROOPS IN ARENA (9x16 grid) ===\n")
+        parts.append("   " + "".join(f"{i:3}" for i in range(ARENA_COLS)) + "\n")
+        for y, cells in enumerate(self.troops_in_arena.tolist()):
+            row = [f"{y:2} "]
+            for cell in cells:
+                if is_empty(cell):
+                    row.append(" . ")
                 else:
-                    state += " . "
-            state += "\n"
-        return state
+                    row.append(f" {cell.color[0].upper()}{cell.name[0]} ")
+            parts.append("".join(row) + "\n")
+        return "".join(parts)
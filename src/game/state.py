@@ -13,9 +13,13 @@ so ``ClashEnv`` can subscribe without subclassing.
 
 from __future__ import annotations
 
+import logging
 import time
+from bisect import bisect_right
 from typing import Callable, Literal, Optional
 
+logger = logging.getLogger(__name__)
+
 MatchResult = Literal["win", "loss", "draw"]
 
 DEFAULT_PRINCESS_HP = 2534
@@ -42,11 +46,27 @@ class GameState:
     DOUBLE_ELIXIR_RATE = 1.4
     TRIPLE_ELIXIR_RATE = 0.93
 
+    INV_NORMAL_ELIXIR_RATE = 1.0 / NORMAL_ELIXIR_RATE
+    INV_DOUBLE_ELIXIR_RATE = 1.0 / DOUBLE_ELIXIR_RATE
+    INV_TRIPLE_ELIXIR_RATE = 1.0 / TRIPLE_ELIXIR_RATE
+
     DOUBLE_ELIXIR_START = 120
     REGULAR_TIME_END = 180
     TRIPLE_ELIXIR_START = 240
     MATCH_MAX_DURATION = 300
 
+    # Phase / rate lookup tables indexed by ``bisect_right`` on elapsed
+    # match time (a threshold counts as reached once elapsed == threshold).
+    _PHASE_THRESHOLDS = (DOUBLE_ELIXIR_START, REGULAR_TIME_END, TRIPLE_ELIXIR_START)
+    _PHASES = ("normal", "double", "overtime_double", "overtime_triple")
+    _ELIXIR_RATE_THRESHOLDS = (DOUBLE_ELIXIR_START, TRIPLE_ELIXIR_START)
+    _ELIXIR_RATES = (NORMAL_ELIXIR_RATE, DOUBLE_ELIXIR_RATE, TRIPLE_ELIXIR_RATE)
+    _INV_ELIXIR_RATES = (
+        INV_NORMAL_ELIXIR_RATE,
+        INV_DOUBLE_ELIXIR_RATE,
+        INV_TRIPLE_ELIXIR_RATE,
+    )
+
     STARTING_ELIXIR = 5.0
     MAX_ELIXIR = 10.0
 
@@ -92,7 +112,7 @@ class GameState:
     # ----- lifecycle -----
 
     def start_match(self) -> None:
-        now = time.time()
+        now = time.monotonic()
         self.match_start_time = now
         self.last_elixir_update = now
         self.current_elixir = self.STARTING_ELIXIR
@@ -105,7 +125,7 @@ class GameState:
         self._destroyed_towers.clear()
         for cb in self._on_start:
             cb(self)
-        print("Match started!")
+        logger.info("Match started!")
 
     def end_match(self, result: Optional[MatchResult] = None) -> None:
         if result is not None:
@@ -113,14 +133,14 @@ class GameState:
         self.is_match_active = False
         for cb in self._on_end:
             cb(self)
-        print(f"Match ended! result={self.match_result}")
+        logger.info("Match ended! result=%s", self.match_result)
 
     # ----- timing -----
 
     def get_current_match_time(self) -> float:
         if not self.is_match_active or self.match_start_time is None:
             return 0
-        elapsed = time.time() - self.match_start_time
+        elapsed = time.monotonic() - self.match_start_time
         return min(elapsed, self.MATCH_MAX_DURATION)
 
     def get_time_remaining(self) -> float:
@@ -132,13 +152,7 @@ class GameState:
         if not self.is_match_active:
             return "ended"
         elapsed = self.get_current_match_time()
-        if elapsed < self.DOUBLE_ELIXIR_START:
-            return "normal"
-        if elapsed < self.REGULAR_TIME_END:
-            return "double"
-        if elapsed < self.TRIPLE_ELIXIR_START:
-            return "overtime_double"
-        return "overtime_triple"
+        return self._PHASES[bisect_right(self._PHASE_THRESHOLDS, elapsed)]
 
     def is_overtime(self) -> bool:
         return self.get_current_match_time() >= self.REGULAR_TIME_END
@@ -147,21 +161,23 @@ class GameState:
 
     def get_elixir_rate(self) -> float:
         elapsed = self.get_current_match_time()
-        if elapsed < self.DOUBLE_ELIXIR_START:
-            return self.NORMAL_ELIXIR_RATE
-        if elapsed < self.TRIPLE_ELIXIR_START:
-            return self.DOUBLE_ELIXIR_RATE
-        return self.TRIPLE_ELIXIR_RATE
+        return self._ELIXIR_RATES[bisect_right(self._ELIXIR_RATE_THRESHOLDS, elapsed)]
 
     def update_elixir(self) -> None:
         if not self.is_match_active:
             return
-        now = time.time()
+        now = time.monotonic()
         if self.last_elixir_update is None:
             self.last_elixir_update = now
             return
-        elapsed = now - self.last_elixir_update
-        gained = elapsed / self.get_elixir_rate()
+        # Pick the rate from this same clock read rather than going back
+        # through get_current_match_time / get_elixir_rate.
+        start = self.match_start_time if self.match_start_time is not None else now
+        elapsed_match = now - start
+        inv_rate = self._INV_ELIXIR_RATES[
+            bisect_right(self._ELIXIR_RATE_THRESHOLDS, elapsed_match)
+        ]
+        gained = (now - self.last_elixir_update) * inv_rate
         self.current_elixir = min(self.MAX_ELIXIR, self.current_elixir + gained)
         self.last_elixir_update = now
 
@@ -173,10 +189,12 @@ class GameState:
         self.update_elixir()
         if self.current_elixir + 1e-6 >= amount:
             self.current_elixir -= amount
-            print(f"Spent {amount} elixir. Remaining: {self.current_elixir:.1f}")
+            logger.debug(
+                "Spent %s elixir. Remaining: %.1f", amount, self.current_elixir
+            )
             return True
-        print(
-            f"Not enough elixir! Have {self.current_elixir:.1f}, need {amount}"
+        logger.debug(
+            "Not enough elixir! Have %.1f, need %s", self.current_elixir, amount
         )
         return False
 
@@ -184,7 +202,7 @@ class GameState:
 
     def set_tower_hp(self, key: str, value: Optional[int]) -> None:
         if key not in self.tower_hp:
-            print(f"Unknown tower key: {key}")
+            logger.warning("Unknown tower key: %s", key)
             return
         self.tower_hp[key] = value
         if value is not None and value <= 0:
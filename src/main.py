@@ -17,12 +17,14 @@ Usage::
 from __future__ import annotations
 
 import argparse
+import logging
 import random
 import time
 from typing import Callable, Optional
 
 import cv2
 import numpy as np
+import pyautogui
 from dotenv import load_dotenv
 
 from .env.actions import Action, action_space_size
@@ -78,12 +80,29 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--seed", type=int, default=None)
     p.add_argument("--window", default=WINDOW_TITLE)
     p.add_argument("--model", default=MODEL_ID)
+    p.add_argument(
+        "--infer-size",
+        type=int,
+        nargs=2,
+        metavar=("W", "H"),
+        default=None,
+        help="resize frames to W H before inference (e.g. the model's input size)",
+    )
     return p.parse_args()
 
 
 def run() -> None:
     args = parse_args()
     load_dotenv()
+    # Library modules log per-frame detail at DEBUG; keep the driver at INFO.
+    logging.basicConfig(
+        level=logging.INFO, format="%(levelname)s %(name)s: %(message)s"
+    )
+    # PyAutoGUI sleeps PAUSE seconds (default 0.1) after every call. Set
+    # here, once, so card drags (env/actions.py) and rematch clicks
+    # (vision/lifecycle.py) get the same timing; the waits the game needs
+    # are explicit ``time.sleep`` calls next to those mouse actions.
+    pyautogui.PAUSE = 0
 
     policy: Policy = RandomPolicy(no_op_prob=args.no_op_prob, seed=args.seed)
 
@@ -91,6 +110,7 @@ def run() -> None:
         window_title=args.window,
         model_id=args.model,
         record_path=args.record,
+        infer_size=tuple(args.infer_size) if args.infer_size else None,
     )
 
     print(f"Action space size: {action_space_size()}")
@@ -117,6 +137,10 @@ def run() -> None:
                         env.board,
                         env.state,
                         lifecycle_state=info.get("lifecycle_state"),
+                        # env._frame is the capture buffer: the next grab
+                        # overwrites it and nothing reads it after step(),
+                        # so draw straight into it (see ClashEnv._frame).
+                        in_place=True,
                     )
                     cv2.imshow("clashBot debug", overlay)
                     if cv2.waitKey(1) & 0xFF == ord("q"):
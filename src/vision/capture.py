@@ -51,6 +51,8 @@ class ScreenCapture:
 
         self._sct: Optional[mss.base.MSSBase] = None
         self._window = None
+        self._bgr_buf: Optional[np.ndarray] = None
+        self._monitor: Optional[dict] = None
 
     # ----- context management -----
 
@@ -76,13 +78,25 @@ class ScreenCapture:
         if self._sct is not None:
             self._sct.__exit__(exc_type, exc, tb)
             self._sct = None
+        self._monitor = None
 
     # ----- frame access -----
 
     @property
     def monitor(self) -> dict:
+        """The capture region in screen coordinates.
+
+        Re-queried from the window on every ``grab`` and served from that
+        cache for the other reads in the same step (action execution,
+        rematch clicks). Treat the returned dict as read-only.
+        """
         if self._window is None:
             raise RuntimeError("ScreenCapture is not open")
+        if self._monitor is None:
+            self._monitor = self._query_monitor()
+        return self._monitor
+
+    def _query_monitor(self) -> dict:
         return {
             "top": self._window.top + self.crop_top,
             "left": self._window.left + self.crop_left,
@@ -91,8 +105,20 @@ class ScreenCapture:
         }
 
     def grab(self) -> np.ndarray:
+        """Capture the game viewport as a BGR frame.
+
+        The returned array is a persistent buffer that the next ``grab``
+        overwrites; copy it if you need to keep a frame around.
+        """
         if self._sct is None:
             raise RuntimeError("ScreenCapture is not open")
-        shot = self._sct.grab(self.monitor)
-        img = np.array(shot)
-        return cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+        self._monitor = self._query_monitor()
+        shot = self._sct.grab(self._monitor)
+        h, w = shot.height, shot.width
+        if self._bgr_buf is None or self._bgr_buf.shape[:2] != (h, w):
+            self._bgr_buf = np.empty((h, w, 3), dtype=np.uint8)
+        # Zero-copy view over mss's BGRA bytes; cvtColor writes straight
+        # into the reused buffer instead of allocating two frames.
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(h, w, 4)
+        cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=self._bgr_buf)
+        return self._bgr_buf
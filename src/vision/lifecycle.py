@@ -179,11 +179,9 @@ class MatchLifecycle:
 
         ok_x = monitor["left"] + int(OK_BUTTON_FRAC[0] * monitor["width"])
         ok_y = monitor["top"] + int(OK_BUTTON_FRAC[1] * monitor["height"])
-        pyautogui.moveTo(ok_x, ok_y)
-        pyautogui.click()
+        pyautogui.click(ok_x, ok_y)
         time.sleep(between_clicks_sec)
 
         battle_x = monitor["left"] + int(BATTLE_BUTTON_FRAC[0] * monitor["width"])
         battle_y = monitor["top"] + int(BATTLE_BUTTON_FRAC[1] * monitor["height"])
-        pyautogui.moveTo(battle_x, battle_y)
-        pyautogui.click()
+        pyautogui.click(battle_x, battle_y)